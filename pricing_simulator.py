@@ -3,6 +3,13 @@ import plotly.express as px
 import pandas as pd
 import numpy as np
 import json
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 
 # =====================
@@ -11,6 +18,142 @@ from openai import OpenAI
 st.set_page_config(page_title="Professional Pricing Studio", page_icon=":briefcase:", layout="centered")
 client = OpenAI(api_key=st.secrets["openai"]["api_key"])
 
+# =====================
+# Shared cache and rate limiter
+# =====================
+# A SQLite file on local disk is shared by every server process on this machine, so identical
+# deterministic analyses are computed once and OpenAI calls from all processes draw on one token bucket.
+shared_settings = st.secrets.get("shared_cache", {})
+SHARED_DB_PATH = shared_settings.get("path", os.path.join(tempfile.gettempdir(), "pricing_simulator_shared.sqlite3"))
+SHARED_CACHE_MAX_ENTRIES = int(shared_settings.get("max_entries", 1000))
+RATE_LIMIT_CAPACITY = float(shared_settings.get("rate_limit_burst", 10))
+RATE_LIMIT_PER_SECOND = float(shared_settings.get("rate_limit_per_second", 1.0))
+RATE_LIMIT_MAX_WAIT = float(shared_settings.get("rate_limit_max_wait", 60.0))
+
+
+SHARED_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS ai_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS rate_bucket (name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS metrics (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+]
+
+
+def shared_db():
+    """Open a connection to the shared store, creating the tables if the file is new or was cleaned up.
+
+    Each call gets its own connection so worker threads never share one. Raises sqlite3.Error if the
+    store is unusable; callers fall back to running without the cache.
+    """
+    conn = sqlite3.connect(SHARED_DB_PATH, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        for statement in SHARED_SCHEMA:
+            conn.execute(statement)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def bump_metric(conn, name, amount=1):
+    conn.execute(
+        "INSERT INTO metrics (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+        (name, int(amount)),
+    )
+
+
+def shared_cache_get(key, is_valid=None):
+    """Return the cached value for key, or None. Counts a hit or a miss.
+
+    An entry that fails is_valid counts as a miss and is deleted so it is regenerated rather than kept warm.
+    """
+    with closing(shared_db()) as conn:
+        row = conn.execute("SELECT value FROM ai_cache WHERE key = ?", (key,)).fetchone()
+        value = None
+        if row is not None:
+            try:
+                value = json.loads(row[0])
+            except ValueError:
+                value = None
+            if value is None or (is_valid is not None and not is_valid(value)):
+                conn.execute("DELETE FROM ai_cache WHERE key = ?", (key,))
+                value = None
+        if value is None:
+            bump_metric(conn, "misses")
+            return None
+        conn.execute("UPDATE ai_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        bump_metric(conn, "hits")
+        return value
+
+
+def shared_cache_put(key, value):
+    """Store value under key, evicting the least recently used entries beyond the size limit."""
+    with closing(shared_db()) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "INSERT OR REPLACE INTO ai_cache (key, value, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time()),
+        )
+        evicted = conn.execute(
+            "DELETE FROM ai_cache WHERE key NOT IN (SELECT key FROM ai_cache ORDER BY last_used DESC LIMIT ?)",
+            (SHARED_CACHE_MAX_ENTRIES,),
+        ).rowcount
+        if evicted > 0:
+            bump_metric(conn, "evictions", evicted)
+        conn.execute("COMMIT")
+
+
+def is_store_busy(exc):
+    """True for lock contention between processes, as opposed to a store that cannot be used at all."""
+    name = getattr(exc, "sqlite_errorname", "")
+    return name.startswith(("SQLITE_BUSY", "SQLITE_LOCKED")) or "locked" in str(exc) or "busy" in str(exc)
+
+
+def rate_limit_acquire(name="openai"):
+    """Take one token from the shared bucket, sleeping until one is free. Counts each request that had to wait once.
+
+    Raises TimeoutError if no token frees up within RATE_LIMIT_MAX_WAIT, including when the store stays locked.
+    """
+    deadline = time.monotonic() + RATE_LIMIT_MAX_WAIT
+    throttled = False
+    while True:
+        try:
+            with closing(shared_db()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                now = time.time()
+                row = conn.execute("SELECT tokens, updated FROM rate_bucket WHERE name = ?", (name,)).fetchone()
+                if row is None:
+                    tokens = RATE_LIMIT_CAPACITY
+                else:
+                    tokens = min(RATE_LIMIT_CAPACITY, row[0] + max(0.0, now - row[1]) * RATE_LIMIT_PER_SECOND)
+                wait = 0.0 if tokens >= 1 else (1 - tokens) / RATE_LIMIT_PER_SECOND
+                if wait == 0.0:
+                    tokens -= 1
+                conn.execute("INSERT OR REPLACE INTO rate_bucket (name, tokens, updated) VALUES (?, ?, ?)", (name, tokens, now))
+                if wait and not throttled:
+                    bump_metric(conn, "throttled")
+                conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            if not is_store_busy(exc):
+                raise
+            # Contention means other processes are calling too; keep waiting rather than calling unthrottled
+            wait = 0.5
+        if wait == 0.0:
+            return
+        throttled = True
+        if time.monotonic() + wait > deadline:
+            raise TimeoutError(f"Rate limit: no request slot free within {RATE_LIMIT_MAX_WAIT:.0f} seconds.")
+        time.sleep(wait)
+
+
+def shared_metrics():
+    with closing(shared_db()) as conn:
+        counts = dict(conn.execute("SELECT name, value FROM metrics").fetchall())
+        entries = conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()[0]
+    return {"hits": 0, "misses": 0, "evictions": 0, "throttled": 0, **counts, "entries": entries}
+
+
 # Background + UI polish
 st.markdown(
     """
@@ -483,6 +626,139 @@ st.header("AI Commercial Analysis")
 
 n_customers = st.slider("Number of simulated customer opinions", 100, 5000, 1000, step=100)
 
+AI_INSTRUCTIONS = (
+    "Act as a pricing and go-to-market advisor for a youth entrepreneur. Use every field in Data and do not ignore any input."
+    " If a field is empty, say \"not provided\" and proceed. Prefer clear, repeatable logic and avoid randomness."
+    " If pricing_mode is Market-based, ground advice in competitor landscape and willingness to pay. If Cost-plus, ground advice in unit economics."
+    " If Value-based, ground advice in customer benefits, alternatives, savings, and willingness to pay. Keep tone encouraging and professional."
+)
+
+# Product basics and the prices customers actually see
+AI_BASE_FIELDS = [
+    "pricing_mode", "product_name", "product_description", "target_audience", "sales_channel", "city", "state", "additional_info",
+    "suggested_price", "target_margin_pct", "unit_cost", "recommended_price", "sweet_spot_low", "sweet_spot_high",
+]
+AI_POSITIONING_FIELDS = [
+    "quality_level", "usp", "features", "demographic", "spending_range", "competition_level",
+    "core_problem", "benefits", "special_adv", "main_strength", "wtp_typical", "wtp_max", "wtp_min_expected",
+]
+# Unit economics behind the price in each pricing mode
+AI_UNIT_ECONOMICS_FIELDS = [
+    "cycle_minutes", "materials", "equipment", "packaging_per_unit", "shipping_per_unit", "other_variable_per_unit",
+    "gross_profit_per_unit", "additional_cost_info", "mb_unit_cost", "mb_min_profitable",
+    "vb_unit_cost", "vb_min_profitable", "money_saved", "minutes_saved", "value_of_time", "estimated_value",
+]
+# What customers compare the price against: competitors in Market-based mode, alternatives in Value-based mode
+AI_MARKET_FIELDS = [
+    "competitors", "comp_low", "comp_avg", "comp_high", "market_notes",
+    "alternatives", "alt_avg_cost", "vb_notes",
+]
+
+# Each section is requested and cached on its own, keyed only by the payload fields it reads,
+# so changing one input re-requests just the sections that use it. "fields": None means every field except n_customers.
+AI_SECTIONS = {
+    "summary": {
+        "title": "Executive View",
+        "fields": None,
+        "max_tokens": 500,
+        "task": "Provide a concise competitiveness assessment using professional vocabulary.",
+        "schema": '{{"competitive_summary": "..."}}',
+    },
+    "aspects": {
+        "title": "Strengths and weaknesses",
+        "fields": AI_BASE_FIELDS + AI_POSITIONING_FIELDS + AI_UNIT_ECONOMICS_FIELDS + AI_MARKET_FIELDS,
+        "max_tokens": 300,
+        "task": 'Provide top 2 strengths and top 2 weaknesses with integer percentages that sum to 100 for each list, plus an "Other" value.',
+        "schema": (
+            '{{"best_aspects": {{"aspect1": "...", "percentage1": 60, "aspect2": "...", "percentage2": 30, "other": 10}},'
+            ' "worst_aspects": {{"aspect1": "...", "percentage1": 50, "aspect2": "...", "percentage2": 35, "other": 15}}}}'
+        ),
+    },
+    "comments": {
+        "title": "Customer commentary",
+        "fields": AI_BASE_FIELDS + AI_POSITIONING_FIELDS + AI_UNIT_ECONOMICS_FIELDS + AI_MARKET_FIELDS + ["comment_count"],
+        "max_tokens": 900,
+        "task": "Return exactly {comment_count} concise customer-style comments tailored to the audience and location, each with a practical improvement.",
+        "schema": '{{"comments": ["..."]}}',
+    },
+    "stars": {
+        "title": "Star ratings",
+        "fields": AI_BASE_FIELDS + AI_UNIT_ECONOMICS_FIELDS + AI_MARKET_FIELDS + [
+            "quality_level", "competition_level", "wtp_typical", "wtp_max", "main_strength", "n_customers",
+        ],
+        "max_tokens": 150,
+        "task": "Provide a star rating distribution (1-5 stars) for {n_customers} simulated reviews, consistent with how these customers would judge the product at this price.",
+        "schema": '{{"star_ratings": {{"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}}}}',
+    },
+}
+
+
+def build_section_params(name, payload):
+    """Build the chat completion request for one analysis section from the fields it depends on."""
+    section = AI_SECTIONS[name]
+    if section["fields"] is None:
+        data = {k: v for k, v in payload.items() if k != "n_customers"}
+    else:
+        available = dict(payload, comment_count=12 if payload["n_customers"] >= 1000 else 8)
+        data = {k: available[k] for k in section["fields"] if k in available}
+
+    prompt = f"""
+    {AI_INSTRUCTIONS}
+
+    Data: {json.dumps(data, sort_keys=True)}
+
+    Task: {section["task"].format(**data)}
+
+    Return valid JSON only with this schema:
+    {section["schema"].format()}
+    """
+
+    params = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": section["max_tokens"],
+        "temperature": 0.0 if deterministic else float(temp_slider),
+        "top_p": 1,
+        "frequency_penalty": 0,
+        "presence_penalty": 0,
+        "response_format": {"type": "json_object"}
+    }
+    if deterministic:
+        params["seed"] = int(seed_value)
+    return params
+
+
+def section_cache_key(params):
+    """Hash the full request so any change to prompt, data, or model settings invalidates the section."""
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def section_is_valid(name, data):
+    """Check a parsed section has the keys and types the renderer expects, so malformed output is never cached."""
+    if not isinstance(data, dict):
+        return False
+    if name == "summary":
+        return isinstance(data.get("competitive_summary"), str)
+    if name == "comments":
+        return isinstance(data.get("comments"), list)
+    if name == "aspects":
+        return isinstance(data.get("best_aspects"), dict) and isinstance(data.get("worst_aspects"), dict)
+    stars = data.get("star_ratings")
+    return isinstance(stars, dict) and all(str(stars.get(str(k), "")).isdigit() for k in range(1, 6))
+
+
+def request_section(params):
+    """Run one section request and return the raw JSON text plus any shared store error. Safe to call from worker threads."""
+    store_error = None
+    try:
+        rate_limit_acquire()
+    except sqlite3.Error as exc:
+        # The store cannot be used at all (lock contention is retried inside rate_limit_acquire),
+        # so there is no bucket to draw from and the call goes out unthrottled
+        store_error = str(exc)
+    resp = client.chat.completions.create(**params)
+    return resp.choices[0].message.content.strip().strip("```json").strip("```").strip(), store_error
+
 if st.button("Generate AI Analysis"):
     payload = {
         "pricing_mode": pricing_mode,
@@ -553,78 +829,105 @@ if st.button("Generate AI Analysis"):
 
     payload["n_customers"] = int(n_customers)
 
-    prompt = f"""
-    Act as a pricing and go-to-market advisor for a youth entrepreneur. Use every field in Data and do not ignore any input. If a field is empty, say "not provided" and proceed. Prefer clear, repeatable logic and avoid randomness. If pricing_mode is Market-based, ground advice in competitor landscape and willingness to pay. If Cost-plus, ground advice in unit economics. If Value-based, ground advice in customer benefits, alternatives, savings, and willingness to pay. Keep tone encouraging and professional.
-
-    Data: {json.dumps(payload, sort_keys=True)}
-
-    Tasks:
-    1) Provide a concise competitiveness assessment using professional vocabulary.
-    2) Return exactly {12 if n_customers>=1000 else 8} concise customer-style comments tailored to the audience and location, each with a practical improvement.
-    3) Provide top 2 strengths and top 2 weaknesses with integer percentages that sum to 100 for each list, plus an "Other" value.
-    4) Provide a star rating distribution (1-5 stars) for {n_customers} simulated reviews aligned to the analysis.
-
-    Return valid JSON only with this schema:
-    {{
-      "competitive_summary": "...",
-      "comments": ["..."],
-      "best_aspects": {{"aspect1": "...", "percentage1": 60, "aspect2": "...", "percentage2": 30, "other": 10}},
-      "worst_aspects": {{"aspect1": "...", "percentage1": 50, "aspect2": "...", "percentage2": 35, "other": 15}},
-      "star_ratings": {{"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}}
-    }}
-    """
+    # Only stale sections are requested, in parallel. Results are shared through the node-wide cache
+    # in deterministic mode, where the same inputs are expected to give the same output.
+    section_params = {name: build_section_params(name, payload) for name in AI_SECTIONS}
+    section_keys = {name: section_cache_key(params) for name, params in section_params.items()}
+    sections = {}
+    store_errors = []
+    if deterministic:
+        for name in AI_SECTIONS:
+            try:
+                cached = shared_cache_get(section_keys[name], lambda value: section_is_valid(name, value))
+            except sqlite3.Error as exc:
+                store_errors.append(str(exc))
+                break
+            if cached is not None:
+                sections[name] = cached
+    stale = [name for name in AI_SECTIONS if name not in sections]
+
+    failed = {}
+    rate_limited = []
+    if stale:
+        with st.spinner(f"Generating {len(stale)} of {len(AI_SECTIONS)} analysis sections..."):
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                futures = {name: pool.submit(request_section, section_params[name]) for name in stale}
+                for name, future in futures.items():
+                    raw = ""
+                    try:
+                        raw, store_error = future.result()
+                        if store_error:
+                            store_errors.append(store_error)
+                        parsed = json.loads(raw)
+                        if not section_is_valid(name, parsed):
+                            raise ValueError(f"Unexpected {name} section shape")
+                    except TimeoutError:
+                        rate_limited.append(name)
+                        continue
+                    except Exception as exc:
+                        failed[name] = raw or str(exc)
+                        continue
+                    sections[name] = parsed
+                    if deterministic and not store_errors:
+                        try:
+                            shared_cache_put(section_keys[name], parsed)
+                        except sqlite3.Error as exc:
+                            store_errors.append(str(exc))
+    if store_errors:
+        st.warning(f"Shared cache is unavailable, so results were not shared with other sessions: {store_errors[0]}")
+    if len(stale) < len(AI_SECTIONS):
+        st.caption(f"Reused {len(AI_SECTIONS) - len(stale)} of {len(AI_SECTIONS)} analysis sections from the shared cache.")
+
+    def section_ready(name):
+        """Return True if the section can be rendered, otherwise show why it is missing in its place."""
+        if name in sections:
+            return True
+        st.markdown(f"### {AI_SECTIONS[name]['title']}")
+        if name in rate_limited:
+            st.warning("Too many AI requests are running right now, so this section was not generated. Please try again in a minute.")
+        else:
+            st.error("AI response could not be parsed. Here is the raw output:")
+            st.code(failed.get(name) or "<no raw output>")
+        return False
 
     try:
-        params = {
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 1800,
-            "temperature": 0.0 if deterministic else float(temp_slider),
-            "top_p": 1,
-            "frequency_penalty": 0,
-            "presence_penalty": 0,
-            "response_format": {"type": "json_object"}
-        }
-        
-        if deterministic:
-            params["seed"] = int(seed_value)
-        
-        resp = client.chat.completions.create(**params)
-        raw = resp.choices[0].message.content.strip().strip("```json").strip("```").strip()
-        data = json.loads(raw)
-        
-        st.markdown("### Executive View")
-        st.info(data.get("competitive_summary", ""))
-        
-        # Strengths and weaknesses
+        data = {}
+        for parsed in sections.values():
+            data.update(parsed)
+
+        if section_ready("summary"):
+            st.markdown("### Executive View")
+            st.info(data.get("competitive_summary", ""))
 
         # Strengths and weaknesses
-        best = data.get("best_aspects", {})
-        worst = data.get("worst_aspects", {})
-        best_table = pd.DataFrame([
-            {"Aspect": best.get("aspect1", "N/A"), "Percent of customers (%)": best.get("percentage1", "N/A")},
-            {"Aspect": best.get("aspect2", "N/A"), "Percent of customers (%)": best.get("percentage2", "N/A")},
-            {"Aspect": "Other", "Percent of customers (%)": best.get("other", "N/A")},
-        ])
-        worst_table = pd.DataFrame([
-            {"Aspect": worst.get("aspect1", "N/A"), "Percent of customers (%)": worst.get("percentage1", "N/A")},
-            {"Aspect": worst.get("aspect2", "N/A"), "Percent of customers (%)": worst.get("percentage2", "N/A")},
-            {"Aspect": "Other", "Percent of customers (%)": worst.get("other", "N/A")},
-        ])
-
-        st.markdown("### Strengths")
-        st.dataframe(best_table, use_container_width=True, hide_index=True)
-        st.markdown("### Weaknesses")
-        st.dataframe(worst_table, use_container_width=True, hide_index=True)
+        if section_ready("aspects"):
+            best = data.get("best_aspects", {})
+            worst = data.get("worst_aspects", {})
+            best_table = pd.DataFrame([
+                {"Aspect": best.get("aspect1", "N/A"), "Percent of customers (%)": best.get("percentage1", "N/A")},
+                {"Aspect": best.get("aspect2", "N/A"), "Percent of customers (%)": best.get("percentage2", "N/A")},
+                {"Aspect": "Other", "Percent of customers (%)": best.get("other", "N/A")},
+            ])
+            worst_table = pd.DataFrame([
+                {"Aspect": worst.get("aspect1", "N/A"), "Percent of customers (%)": worst.get("percentage1", "N/A")},
+                {"Aspect": worst.get("aspect2", "N/A"), "Percent of customers (%)": worst.get("percentage2", "N/A")},
+                {"Aspect": "Other", "Percent of customers (%)": worst.get("other", "N/A")},
+            ])
+
+            st.markdown("### Strengths")
+            st.dataframe(best_table, use_container_width=True, hide_index=True)
+            st.markdown("### Weaknesses")
+            st.dataframe(worst_table, use_container_width=True, hide_index=True)
 
         # Customer comments
-        comments = data.get("comments", [])
-        st.markdown("### Customer commentary")
-        if comments:
-            for c in comments:
-                st.info(f"🗣️ {c}")
-        else:
-            st.write("No comments available.")
+        if section_ready("comments"):
+            comments = data.get("comments", [])
+            st.markdown("### Customer commentary")
+            if comments:
+                for c in comments:
+                    st.info(f"🗣️ {c}")
+            else:
+                st.write("No comments available.")
 
         # Detailed financials if Cost-plus
         if pricing_mode == "Cost-plus":
@@ -669,26 +972,43 @@ if st.button("Generate AI Analysis"):
             st.dataframe(pd.DataFrame(vbrows), use_container_width=True, hide_index=True)
 
         # Star ratings pie chart
-        stars = data.get("star_ratings", {}) or {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
-        total_reported = sum(int(v) for v in stars.values()) if all(str(v).isdigit() for v in stars.values()) else 0
-        if total_reported != int(n_customers):
-            vals = np.array([max(0, int(stars.get(str(k), 0))) for k in range(1,6)], dtype=int)
-            s = vals.sum()
-            if s == 0:
-                vals = np.array([0,0,0,int(n_customers*0.4), int(n_customers*0.6)], dtype=int)
+        if section_ready("stars"):
+            stars = data.get("star_ratings", {}) or {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
+            total_reported = sum(int(v) for v in stars.values()) if all(str(v).isdigit() for v in stars.values()) else 0
+            if total_reported != int(n_customers):
+                vals = np.array([max(0, int(stars.get(str(k), 0))) for k in range(1,6)], dtype=int)
                 s = vals.sum()
-            if s != n_customers:
-                diff = int(n_customers) - int(s)
-                vals[-1] += diff
-            stars = {str(i+1): int(vals[i]) for i in range(5)}
-        star_df = pd.DataFrame({"Stars": ["1★","2★","3★","4★","5★"], "Count": [stars["1"], stars["2"], stars["3"], stars["4"], stars["5"]]})
-        star_fig = px.pie(star_df, names="Stars", values="Count", title=f"Star Ratings Distribution ({int(n_customers)} reviews)")
-        star_fig.update_traces(textinfo='label+percent')
-        st.plotly_chart(star_fig, use_container_width=True)
+                if s == 0:
+                    vals = np.array([0,0,0,int(n_customers*0.4), int(n_customers*0.6)], dtype=int)
+                    s = vals.sum()
+                if s != n_customers:
+                    diff = int(n_customers) - int(s)
+                    vals[-1] += diff
+                stars = {str(i+1): int(vals[i]) for i in range(5)}
+            star_df = pd.DataFrame({"Stars": ["1★","2★","3★","4★","5★"], "Count": [stars["1"], stars["2"], stars["3"], stars["4"], stars["5"]]})
+            star_fig = px.pie(star_df, names="Stars", values="Count", title=f"Star Ratings Distribution ({int(n_customers)} reviews)")
+            star_fig.update_traces(textinfo='label+percent')
+            st.plotly_chart(star_fig, use_container_width=True)
 
     except Exception:
-        st.error("AI response could not be parsed. Here is the raw output:")
-        st.code(locals().get("raw", "<no raw output>"))
+        st.error("AI analysis could not be displayed. Here is the output received:")
+        st.code(json.dumps(sections, indent=2))
+
+# Rendered last so the counts include this run
+with st.sidebar:
+    st.header("Shared cache")
+    try:
+        metrics = shared_metrics()
+    except sqlite3.Error as exc:
+        st.warning(f"Shared cache is unavailable: {exc}")
+    else:
+        m1, m2 = st.columns(2)
+        m1.metric("Cache hits", metrics["hits"])
+        m2.metric("Cache misses", metrics["misses"])
+        m3, m4 = st.columns(2)
+        m3.metric("Evictions", metrics["evictions"])
+        m4.metric("Throttled requests", metrics["throttled"])
+        st.caption(f"{metrics['entries']} cached sections shared by all server processes on this machine.")
 
 st.markdown("---")
 st.caption("Built with Streamlit and OpenAI • Cost-plus, market-based, and value-based pricing paths.")